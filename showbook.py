@@ -6,15 +6,24 @@ Because someone said they should make a book for that. So we did.
 """
 
 import argparse
-import json
+import functools
+import hashlib
+import itertools
 import os
+import queue
 import sys
+import threading
 import time
-from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
 
+import orjson
 import requests
-from fpdf import FPDF
+from fpdf import FPDF, XPos, YPos
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 # TMDB caps discover results at 500 pages (10,000 titles per query).
 # We default to ALL of them. This is the point.
@@ -23,18 +32,57 @@ TMDB_MAX_PAGES = 500
 TMDB_BASE = "https://api.themoviedb.org/3"
 
 # Major US streaming providers (TMDB watch provider IDs)
-PROVIDERS = OrderedDict([
-    (8, "Netflix"),
-    (9, "Amazon Prime Video"),
-    (337, "Disney+"),
-    (15, "Hulu"),
-    (384, "Max"),
-    (350, "Apple TV+"),
-    (386, "Peacock"),
-    (531, "Paramount+"),
-])
-
-REQUEST_DELAY = 0.26  # ~4 req/s, well under TMDB's 40/10s limit
+PROVIDERS = {
+    8: "Netflix",
+    9: "Amazon Prime Video",
+    337: "Disney+",
+    15: "Hulu",
+    384: "Max",
+    350: "Apple TV+",
+    386: "Peacock",
+    531: "Paramount+",
+}
+
+# TMDB allows 40 requests per 10 seconds, shared by every fetch thread
+RATE_LIMIT_REQUESTS = 40
+RATE_LIMIT_PERIOD = 10.0
+FETCH_WORKERS = 8
+PROGRESS_EVERY = 25  # pages between progress lines for one query
+
+# Keeps progress lines from concurrent fetches from interleaving
+PRINT_LOCK = threading.Lock()
+
+# One keep-alive session for every TMDB call, so a full run reuses a pooled
+# TLS connection instead of doing thousands of fresh handshakes. Everything
+# goes to one host, so a single pool holding one connection per fetch worker
+# is enough; blocking on it means a burst never opens throwaway connections.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=FETCH_WORKERS,
+    pool_block=True,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ),
+))
+SESSION.headers.update({
+    "Accept": "application/json",
+    # gzip and deflate, plus br/zstd when urllib3 has a decoder installed
+    "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+    "User-Agent": "ShowBook/1.0",
+})
+
+# Raw TMDB responses are kept on disk for a day, so re-runs skip the network
+HTTP_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "showbook",
+)
+HTTP_CACHE_TTL = 24 * 60 * 60  # seconds
+# Stale entries are kept for revalidation, but not forever
+HTTP_CACHE_MAX_AGE = 7 * HTTP_CACHE_TTL
 
 # KDP paperback specs — 6"x9" trim, no bleed (text only)
 TRIM_W_MM = 152.4   # 6"
@@ -60,16 +108,129 @@ def get_api_key(cli_key=None):
     return key
 
 
+class InvalidAPIKeyError(Exception):
+    """TMDB rejected the API key (HTTP 401)."""
+
+
+class RateLimiter:
+    """Thread-safe sliding-window limiter: at most `rate` calls per `per` seconds."""
+
+    def __init__(self, rate=RATE_LIMIT_REQUESTS, per=RATE_LIMIT_PERIOD):
+        self.rate = rate
+        self.per = per
+        self._stamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until another request is allowed, then record it."""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._stamps and now - self._stamps[0] >= self.per:
+                    self._stamps.popleft()
+                if len(self._stamps) < self.rate:
+                    self._stamps.append(now)
+                    return
+                time.sleep(self.per - (now - self._stamps[0]))
+
+
+# Shared by every thread that talks to TMDB, like SESSION
+RATE_LIMITER = RateLimiter()
+
+
+def _cache_path(endpoint, params):
+    """Cache file for a request, keyed on endpoint and query (minus API key)."""
+    key = orjson.dumps([endpoint, sorted((params or {}).items())])
+    return os.path.join(HTTP_CACHE_DIR, hashlib.sha256(key).hexdigest() + ".http.json")
+
+
+def _read_cache(path):
+    """Return (entry, age in seconds), or (None, None) if there is no usable entry."""
+    try:
+        age = time.time() - os.path.getmtime(path)
+        with open(path, "rb") as f:
+            return orjson.loads(f.read()), age
+    except (OSError, ValueError):
+        return None, None  # missing, unreadable or corrupt: fetch it again
+
+
+def _write_cache(path, entry):
+    """Best-effort: a cache that can't be written just means no caching."""
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(entry))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def prune_http_cache():
+    """Delete cache files not refreshed within HTTP_CACHE_MAX_AGE (best-effort)."""
+    cutoff = time.time() - HTTP_CACHE_MAX_AGE
+    try:
+        entries = list(os.scandir(HTTP_CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
 def tmdb_get(endpoint, api_key, params=None):
-    """Make a TMDB API request with basic error handling."""
-    params = params or {}
+    """Make a TMDB API request with basic error handling.
+
+    Responses are cached in HTTP_CACHE_DIR. An entry younger than
+    HTTP_CACHE_TTL is returned without a request (or a RATE_LIMITER slot).
+    An older one is revalidated with its ETag / Last-Modified, and a
+    304 Not Modified reuses the cached body.
+    """
+    path = _cache_path(endpoint, params)
+    entry, age = _read_cache(path)
+    if entry is not None and age < HTTP_CACHE_TTL:
+        return entry["body"]
+
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    params = dict(params or {})
     params["api_key"] = api_key
-    resp = requests.get(f"{TMDB_BASE}{endpoint}", params=params, timeout=30)
+    RATE_LIMITER.acquire()
+    resp = SESSION.get(
+        f"{TMDB_BASE}{endpoint}", params=params, headers=headers, timeout=30,
+    )
     if resp.status_code == 401:
-        print("Error: Invalid API key.")
-        sys.exit(1)
+        raise InvalidAPIKeyError()
+    if resp.status_code == 304 and entry is not None:
+        # Still current: rewriting it makes it fresh for another
+        # HTTP_CACHE_TTL and picks up any validators the 304 updated
+        _write_cache(path, {
+            "etag": resp.headers.get("ETag") or entry.get("etag"),
+            "last_modified": (resp.headers.get("Last-Modified")
+                              or entry.get("last_modified")),
+            "body": entry["body"],
+        })
+        return entry["body"]
     resp.raise_for_status()
-    return resp.json()
+
+    body = orjson.loads(resp.content)
+    _write_cache(path, {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "body": body,
+    })
+    return body
 
 
 def list_providers(api_key, region):
@@ -85,77 +246,123 @@ def list_providers(api_key, region):
     print(f"\n  Providers marked with <-- are included by default.")
 
 
-def fetch_titles(api_key, provider_id, media_type, region, max_pages, label=""):
-    """Fetch all titles for a provider/media_type from TMDB discover."""
-    titles = []
-    page = 1
-    total_pages = "?"
+def fetch_page(api_key, provider_id, media_type, region, page):
+    """Fetch one raw page of TMDB discover results."""
+    return tmdb_get(f"/discover/{media_type}", api_key, {
+        "with_watch_providers": provider_id,
+        "watch_region": region,
+        "with_watch_monetization_types": "flatrate",
+        "sort_by": "popularity.desc",
+        "page": page,
+    })
 
-    while page <= max_pages:
-        data = tmdb_get(f"/discover/{media_type}", api_key, {
-            "with_watch_providers": provider_id,
-            "watch_region": region,
-            "with_watch_monetization_types": "flatrate",
-            "sort_by": "popularity.desc",
-            "page": page,
-        })
 
-        api_total = min(data.get("total_pages", 1), max_pages)
-        total_pages = api_total
+def fetch_titles(api_key, provider_id, media_type, region, max_pages, pool,
+                 label=""):
+    """Fetch all titles for a provider/media_type from TMDB discover.
+
+    Page 1 says how many pages there are; the rest are then fetched
+    concurrently on `pool`.
+    """
+    fetch = functools.partial(fetch_page, api_key, provider_id, media_type, region)
+    first = pool.submit(fetch, 1).result()
+    total_pages = min(first.get("total_pages", 1), max_pages)
+    rest = pool.map(fetch, range(2, total_pages + 1))
 
+    # Dedup while ingesting (the first-fetched copy wins). Titles are kept
+    # as parallel lists, with the casefolded key saved for the sort.
+    seen = set()
+    keys = []
+    names = []
+    years = []
+    for done, data in enumerate(itertools.chain([first], rest), start=1):
+        if done % PROGRESS_EVERY == 0 and done < total_pages:
+            with PRINT_LOCK:
+                print(f"    {label}: {done}/{total_pages} pages", flush=True)
         for item in data.get("results", []):
             name = item.get("title") or item.get("name") or "Unknown"
-            year = None
-            release = item.get("release_date") or item.get("first_air_date") or ""
-            if release:
-                year = release[:4]
-            titles.append((name, year))
-
-        # Live progress
-        print(f"\r    {label}: page {page}/{total_pages}"
-              f" ({len(titles)} titles)", end="", flush=True)
+            key = name.casefold()
+            if key in seen:
+                continue
+            seen.add(key)
+            keys.append(key)
+            names.append(name)
+            release = item.get("release_date") or item.get("first_air_date")
+            years.append(release[:4] if release else None)
 
-        if page >= data.get("total_pages", 1):
-            break
-        page += 1
-        time.sleep(REQUEST_DELAY)
+    with PRINT_LOCK:
+        print(f"    {label}: {total_pages} pages ({len(names)} titles)", flush=True)
 
-    print()  # newline after progress
+    # Sort alphabetically via an index array over the parallel lists
+    return [
+        (names[i], years[i]) for i in sorted(range(len(keys)), key=keys.__getitem__)
+    ]
 
-    # Deduplicate and sort alphabetically
-    seen = set()
-    unique = []
-    for name, year in titles:
-        key = name.lower()
-        if key not in seen:
-            seen.add(key)
-            unique.append((name, year))
-    return sorted(unique, key=lambda t: t[0].casefold())
 
+def fetch_all(api_key, region, max_pages, sections=None):
+    """Fetch catalogs for all providers. Returns a dict in PROVIDERS order.
 
-def fetch_all(api_key, region, max_pages):
-    """Fetch catalogs for all providers. Returns OrderedDict."""
-    catalog = OrderedDict()
+    If `sections` is a queue, each provider is also put on it as
+    (provider_name, movies, shows) as soon as it is complete, in PROVIDERS
+    order, followed by a None sentinel once everything has been fetched.
+    """
+    catalog = {}
     total_movies = 0
     total_shows = 0
 
-    for provider_id, provider_name in PROVIDERS.items():
-        print(f"\n  {provider_name}")
-
-        movies = fetch_titles(
-            api_key, provider_id, "movie", region, max_pages, label="Movies",
-        )
-        shows = fetch_titles(
-            api_key, provider_id, "tv", region, max_pages, label="Shows ",
-        )
+    prune_http_cache()
 
-        if not movies and not shows:
-            print(f"    (no results — provider ID {provider_id} may be wrong,")
-            print(f"     try --list-providers to find the correct ID)")
+    # Fan the provider x media fetches out over a thread pool. Every page
+    # request runs on a second, shared pool sized to the connection pool.
+    print()
+    page_pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    jobs = {}
+    for provider_id, provider_name in PROVIDERS.items():
+        for media_type, label in (("movie", "Movies"), ("tv", "Shows")):
+            future = pool.submit(
+                fetch_titles, api_key, provider_id, media_type, region,
+                max_pages, page_pool, label=f"{provider_name} {label}",
+            )
+            jobs[future] = (provider_id, media_type)
 
-        catalog[provider_name] = {"Movies": movies, "Shows": shows}
-        total_movies += len(movies)
-        total_shows += len(shows)
+    providers = list(PROVIDERS.items())
+    done = 0
+    results = {}
+    try:
+        for future in as_completed(jobs):
+            results[jobs[future]] = future.result()
+
+            # Hand providers on in book order as soon as both halves are in
+            while done < len(providers):
+                provider_id, provider_name = providers[done]
+                if ((provider_id, "movie") not in results
+                        or (provider_id, "tv") not in results):
+                    break
+                movies = results.pop((provider_id, "movie"))
+                shows = results.pop((provider_id, "tv"))
+                done += 1
+
+                if not movies and not shows:
+                    with PRINT_LOCK:
+                        print(f"    {provider_name}: no results — provider ID"
+                              f" {provider_id} may be wrong,")
+                        print(f"    try --list-providers to find the correct ID")
+
+                catalog[provider_name] = {"Movies": movies, "Shows": shows}
+                total_movies += len(movies)
+                total_shows += len(shows)
+                if sections is not None:
+                    sections.put((provider_name, movies, shows))
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        page_pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    page_pool.shutdown()
+
+    if sections is not None:
+        sections.put(None)
 
     print(f"\n  Total: {total_movies} movies + {total_shows} shows"
           f" = {total_movies + total_shows} titles")
@@ -175,18 +382,18 @@ def save_cache(catalog, region):
         "region": region,
         "providers": catalog,
     }
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     print(f"  Cache saved: {filename}")
     return filename
 
 
 def load_cache(path):
     """Load catalog from a JSON cache file. Returns (catalog, fetch_date)."""
-    with open(path) as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
     # Convert lists back to tuples
-    catalog = OrderedDict()
+    catalog = {}
     for provider, sections in data["providers"].items():
         catalog[provider] = {
             "Movies": [tuple(t) for t in sections["Movies"]],
@@ -208,6 +415,7 @@ def load_cache(path):
 # KDP-ready PDF
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=65536)
 def safe(text):
     """Make text safe for built-in PDF fonts (latin-1)."""
     return text.encode("latin-1", errors="replace").decode("latin-1")
@@ -216,14 +424,22 @@ def safe(text):
 class ShowBook(FPDF):
     """The sacred text — KDP paperback interior, 6x9."""
 
+    # Running header and page number font
+    RUNNING_FONT = ("Helvetica", "I", 7.5)
+
     def __init__(self, edition_date=None):
         super().__init__(unit="mm", format=(TRIM_W_MM, TRIM_H_MM))
         self.set_auto_page_break(auto=False)
         self.alias_nb_pages()
         d = edition_date or date.today()
         self._edition = d.strftime("%Y/%m/%d")
+        self._header_text = safe(f"The Show and Movie Catalogue: {self._edition} Edition")
         # Content area bottom limit (page height - bottom margin)
         self._bottom = TRIM_H_MM - MARGIN_BOTTOM_MM
+        # (provider_name, n_movies, n_shows) per section, for the index
+        self._index = []
+        # Set when a page break has already opened the next page for us
+        self._page_ready = False
 
     def _apply_margins(self):
         """Set alternating gutter margins for the current page."""
@@ -239,35 +455,50 @@ class ShowBook(FPDF):
         # Reset x position to respect new left margin
         self.set_x(self.l_margin)
 
+    def _next_page(self):
+        """Start a new page, unless one was just opened and left empty."""
+        if self._page_ready:
+            self._page_ready = False
+        else:
+            self.add_page()
+
+    def _running_text(self, h, text):
+        """Same as cell(0, h, text, align="C"), minus cell()'s per-call work.
+
+        Runs twice on every page, so it places the text directly.
+        """
+        w = self.w - self.r_margin - self.x
+        x = self.x + (w - self.get_string_width(text)) / 2
+        self.text(x, self.y + h / 2 + 0.3 * self.font_size, text)
+
     def header(self):
         self._apply_margins()
         if self.page_no() > 1:
-            self.set_font("Helvetica", "I", 7.5)
-            self.cell(
-                0, 6,
-                safe(f"The Show and Movie Catalogue: {self._edition} Edition"),
-                align="C",
-            )
+            self.set_font(*self.RUNNING_FONT)
+            self._running_text(6, self._header_text)
             self.ln(8)
 
     def footer(self):
         self.set_y(-MARGIN_BOTTOM_MM)
-        self.set_font("Helvetica", "I", 7.5)
-        self.cell(0, 6, f"{self.page_no()}", align="C")
+        self.set_font(*self.RUNNING_FONT)
+        self._running_text(6, f"{self.page_no()}")
 
     def title_page(self):
         self.add_page()
         self.set_font("Helvetica", "", 12)
-        self.cell(0, 45, "", ln=True)
-        self.cell(0, 8, "The", ln=True, align="C")
+        self.cell(0, 45, "", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        self.cell(0, 8, "The", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
 
         self.set_font("Helvetica", "B", 34)
-        self.cell(0, 15, "Show and Movie", ln=True, align="C")
-        self.cell(0, 15, "Catalogue", ln=True, align="C")
+        self.cell(0, 15, "Show and Movie", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+        self.cell(0, 15, "Catalogue", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
 
         self.ln(6)
         self.set_font("Helvetica", "", 16)
-        self.cell(0, 10, safe(f"{self._edition} Edition"), ln=True, align="C")
+        self.cell(
+            0, 10, safe(f"{self._edition} Edition"),
+            new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C",
+        )
 
         self.ln(20)
         self.set_font("Helvetica", "I", 9)
@@ -283,40 +514,56 @@ class ShowBook(FPDF):
 
         self.ln(15)
         self.set_font("Helvetica", "", 9)
-        self.cell(0, 5, safe("(Already out of date.)"), ln=True, align="C")
+        self.cell(
+            0, 5, safe("(Already out of date.)"),
+            new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C",
+        )
 
-    def index_page(self, catalog):
+    def index_page(self):
+        """Reserve the index page; it is drawn once every section is in."""
         self.add_page()
+        self.insert_toc_placeholder(self._render_index)
+        # The placeholder breaks to a fresh page for the first section, but
+        # carries the index page's x over, so re-apply this page's margins
+        self._apply_margins()
+        self._page_ready = True
+
+    def _render_index(self, pdf, outline):
+        """insert_toc_placeholder callback: fill in the reserved index page."""
+        self._apply_margins()
         self.set_font("Helvetica", "B", 24)
-        self.cell(0, 14, "Index", ln=True)
+        self.cell(0, 14, "Index", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         y = self.get_y()
         self.line(self.l_margin, y, TRIM_W_MM - self.r_margin, y)
         self.ln(8)
 
         self.set_font("Helvetica", "", 11)
-        for provider_name, sections in catalog.items():
-            n_movies = len(sections["Movies"])
-            n_shows = len(sections["Shows"])
-            self.cell(0, 7, safe(provider_name), ln=True)
+        for provider_name, n_movies, n_shows in self._index:
+            self.cell(0, 7, safe(provider_name), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
             self.set_font("Helvetica", "", 9)
-            self.cell(0, 6, safe(f"    {n_movies} movies, {n_shows} shows"), ln=True)
+            self.cell(
+                0, 6, safe(f"    {n_movies} movies, {n_shows} shows"),
+                new_x=XPos.LMARGIN, new_y=YPos.NEXT,
+            )
             self.ln(2)
             self.set_font("Helvetica", "", 11)
 
         self.ln(8)
-        total = sum(
-            len(s["Movies"]) + len(s["Shows"]) for s in catalog.values()
-        )
+        total = sum(n_movies + n_shows for _, n_movies, n_shows in self._index)
         y = self.get_y()
         self.line(self.l_margin, y, TRIM_W_MM - self.r_margin, y)
         self.ln(4)
         self.set_font("Helvetica", "B", 11)
-        self.cell(0, 7, safe(f"{total} titles across {len(catalog)} services"), ln=True)
+        self.cell(
+            0, 7, safe(f"{total} titles across {len(self._index)} services"),
+            new_x=XPos.LMARGIN, new_y=YPos.NEXT,
+        )
 
     def provider_section(self, provider_name, movies, shows):
-        self.add_page()
+        self._index.append((provider_name, len(movies), len(shows)))
+        self._next_page()
         self.set_font("Helvetica", "B", 26)
-        self.cell(0, 14, safe(provider_name), ln=True)
+        self.cell(0, 14, safe(provider_name), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         y = self.get_y()
         self.line(self.l_margin, y, TRIM_W_MM - self.r_margin, y)
         self.ln(6)
@@ -327,21 +574,38 @@ class ShowBook(FPDF):
 
     def _title_list(self, heading, titles):
         self.set_font("Helvetica", "B", 14)
-        self.cell(0, 9, safe(f"{heading} ({len(titles)})"), ln=True)
+        self.cell(0, 9, safe(f"{heading} ({len(titles)})"), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         self.ln(2)
         self.set_font("Helvetica", "", 8)
-        for name, year in titles:
+        line_h = 4.2
+        # Where cell() would put the baseline inside a line_h-high row
+        baseline = line_h / 2 + 0.3 * self.font_size
+        lines = [
+            safe(f"  {name} ({year})" if year else f"  {name}")
+            for name, year in titles
+        ]
+        # Lay out a page's worth of titles at a time with bare text() calls,
+        # which skip all of cell()'s per-call bookkeeping
+        start = 0
+        while start < len(lines):
             if self.get_y() > self._bottom:
                 self.add_page()
-            suffix = f" ({year})" if year else ""
-            self.cell(0, 4.2, safe(f"  {name}{suffix}"), ln=True)
+            y = self.get_y()
+            # Lines keep starting until one would begin below the bottom limit
+            fit = int((self._bottom - y) / line_h + 1e-6) + 1
+            x = self.l_margin + self.c_margin
+            for line in lines[start:start + fit]:
+                self.text(x, y + baseline, line)
+                y += line_h
+            self.set_y(y)
+            start += fit
 
     def back_matter(self):
-        self.add_page()
+        self._next_page()
         self.set_font("Helvetica", "", 9)
-        self.cell(0, 70, "", ln=True)
+        self.cell(0, 70, "", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         self.set_font("Helvetica", "B", 12)
-        self.cell(0, 7, "Colophon", ln=True, align="C")
+        self.cell(0, 7, "Colophon", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
         self.ln(4)
         self.set_font("Helvetica", "", 9)
         self.multi_cell(0, 5, safe(
@@ -358,14 +622,19 @@ class ShowBook(FPDF):
         ), align="C")
 
 
-def generate_pdf(catalog, output_path, edition_date=None):
+def generate_pdf(sections, output_path, edition_date=None):
+    """Render the book from an iterable of (provider_name, movies, shows).
+
+    Sections are consumed one at a time, so `sections` may still be filling
+    up while the earlier ones are being rendered.
+    """
     pdf = ShowBook(edition_date=edition_date)
 
     pdf.title_page()
-    pdf.index_page(catalog)
+    pdf.index_page()
 
-    for provider_name, sections in catalog.items():
-        pdf.provider_section(provider_name, sections["Movies"], sections["Shows"])
+    for provider_name, movies, shows in sections:
+        pdf.provider_section(provider_name, movies, shows)
 
     pdf.back_matter()
 
@@ -374,7 +643,7 @@ def generate_pdf(catalog, output_path, edition_date=None):
         pdf.add_page()
 
     pages = pdf.page_no()
-    pdf.output(output_path)
+    write_pdf(output_path, pdf.output())
 
     if pages > KDP_MAX_PAGES:
         print(f"\n  WARNING: {pages} pages exceeds KDP's {KDP_MAX_PAGES}-page limit.")
@@ -383,6 +652,55 @@ def generate_pdf(catalog, output_path, edition_date=None):
     return output_path, pages
 
 
+def write_pdf(path, data, chunk_size=1 << 20):
+    """Write the rendered book in chunks, fsync it, then drop it from the page cache."""
+    data = memoryview(data)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        pos = 0
+        while pos < len(data):
+            pos += os.write(fd, data[pos:pos + chunk_size])
+        os.fsync(fd)
+        # The book is big and nothing here reads it back
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+class PdfWorker(threading.Thread):
+    """Renders provider sections from a queue while fetching is still running."""
+
+    def __init__(self, output_path, edition_date=None):
+        # Daemon, so a failed fetch exits without writing a partial book
+        super().__init__(name="pdf-worker", daemon=True)
+        self.sections = queue.Queue(maxsize=2)
+        self.output_path = output_path
+        self.edition_date = edition_date
+        self._result = None
+        self._error = None
+
+    def run(self):
+        try:
+            self._result = generate_pdf(
+                iter(self.sections.get, None), self.output_path,
+                edition_date=self.edition_date,
+            )
+        except BaseException as exc:
+            self._error = exc
+            # Keep draining so fetch_all never blocks on a full queue
+            while self.sections.get() is not None:
+                pass
+
+    def wait(self):
+        """Join the worker and return generate_pdf's (output_path, pages)."""
+        self.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -447,7 +765,10 @@ def main():
         )
         print(f"  {total} titles across {len(catalog)} services")
         print(f"\n  Generating KDP-ready PDF (6\"x9\")...")
-        output, pages = generate_pdf(catalog, args.output, edition_date=fetch_date)
+        output, pages = generate_pdf(
+            ((name, s["Movies"], s["Shows"]) for name, s in catalog.items()),
+            args.output, edition_date=fetch_date,
+        )
         print(f"\n  Done! {pages} pages: {output}")
         return
 
@@ -469,18 +790,29 @@ def main():
     else:
         print(f"  Mode: {args.max_pages} pages per query")
 
-    catalog = fetch_all(api_key, args.region, args.max_pages)
-    cache_file = save_cache(catalog, args.region)
-
     if args.fetch_only:
+        catalog = fetch_all(api_key, args.region, args.max_pages)
+        cache_file = save_cache(catalog, args.region)
         print(f"\n  Fetch complete. Re-run with --from-cache {cache_file} to generate PDF.")
         return
 
-    print(f"\n  Generating KDP-ready PDF (6\"x9\")...")
-    output, pages = generate_pdf(catalog, args.output)
+    # Render each provider's section as soon as it has been fetched
+    worker = PdfWorker(args.output)
+    worker.start()
+    catalog = fetch_all(api_key, args.region, args.max_pages, sections=worker.sections)
+    save_cache(catalog, args.region)
+
+    print(f"\n  Finishing KDP-ready PDF (6\"x9\")...")
+    output, pages = worker.wait()
     print(f"\n  Done! {pages} pages: {output}")
     print(f"  Now go upload it to KDP like the maniac you are.")
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except InvalidAPIKeyError:
+        # May come from any fetch thread; report it just once
+        with PRINT_LOCK:
+            print("\nError: Invalid API key.")
+        sys.exit(1)